@@ -7,55 +7,103 @@ associated with a particular YouTube channel.
 
 Requirements:
 - Google API key
-- google-api-python-client library
+- aiohttp library
+- aiolimiter library
+- diskcache library
+- ijson library
+- orjson library
 
 Usage:
     python channel_videos.py --channel-id CHANNEL_ID --api-key YOUR_API_KEY
     python channel_videos.py --channel-url https://www.youtube.com/@channelname
 """
 
-import json
+import os
 import sys
-import time
 import re
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import List, Dict, Optional
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from typing import Callable, List, Dict, Optional
+import aiohttp
+import diskcache
+import ijson
+import orjson
+from youtube_api import YouTubeAPIClient
 
 MAX_QUERY_SIZE = 50
 
+# Channel identifier formats accepted by get_channel_id_from_username, named by group
+_CHANNEL_URL_RE = re.compile(
+    r'youtube\.com/(?:@(?P<handle>[^/?]+)|channel/(?P<channel_id>[^/?]+)|(?:c|user)/(?P<username>[^/?]+))'
+    r'|(?P<other_url>youtube\.com)'
+    r'|^@(?P<bare_handle>.+)$'
+)
+
+# Channel IDs are "UC" followed by 22 URL-safe base64 characters
+_CHANNEL_ID_RE = re.compile(r'UC[A-Za-z0-9_-]{22}')
+
+# Partial response for videos.list: only the fields kept by get_video_details
+VIDEO_DETAILS_FIELDS = ('items(id,snippet(title,description,publishedAt,thumbnails/default/url),'
+                        'statistics(viewCount,likeCount,commentCount))')
+
+# Resolved channel IDs and video metadata persist here between runs
+CACHE_DIR = '.vibecheck-cache'
+VIDEO_DETAILS_EXPIRE = 86400  # seconds
+# Handles can be released and reassigned, so resolved channel IDs are looked up again after a week
+CHANNEL_ID_EXPIRE = 7 * 86400  # seconds
+
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+_disk_cache = None
 
-class YouTubeChannelVideoFetcher:
-    """Fetches video IDs from YouTube channels using the YouTube Data API v3."""
+
+def _get_disk_cache() -> diskcache.Cache:
+    """Open the on-disk cache on first use."""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = diskcache.Cache(CACHE_DIR)
+    return _disk_cache
+
+
+def cached(key: Callable[..., str], expire: Optional[float] = None):
+    """
+    Cache the results of an async method in memory and on disk. None results are not cached.
     
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize the YouTubeChannelVideoFetcher.
+    Args:
+        key: Builds the cache key from the method's arguments
+        expire: Seconds until the on-disk entry expires (None keeps it forever)
+    """
+    def decorator(func):
+        memory = {}
         
-        Args:
-            api_key: YouTube Data API key
-        """
-        self.api_key = api_key
-        self.youtube = None
-        self._initialize_api()
-    
-    def _initialize_api(self):
-        """Initialize the YouTube API client."""
-        try:
-            if self.api_key:
-                self.youtube = build('youtube', 'v3', developerKey=self.api_key)
-            else:
-                raise ValueError("api_key must be provided")
-                
-        except Exception as e:
-            logger.error(f"  Error initializing YouTube API: {e}")
-            sys.exit(1)
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = f"{func.__name__}:{key(*args, **kwargs)}"
+            if cache_key in memory:
+                return memory[cache_key]
+            
+            result = _get_disk_cache().get(cache_key)
+            if result is None:
+                result = await func(*args, **kwargs)
+                if result is None:
+                    return None
+                _get_disk_cache().set(cache_key, result, expire=expire)
+            
+            memory[cache_key] = result
+            return result
+        
+        return wrapper
+    return decorator
+
+
+class YouTubeChannelVideoFetcher(YouTubeAPIClient):
+    """Fetches video IDs from YouTube channels using the YouTube Data API v3."""
     
-    def get_channel_id_from_username(self, username: str) -> Optional[str]:
+    @cached(key=lambda self, username: username, expire=CHANNEL_ID_EXPIRE)
+    async def get_channel_id_from_username(self, username: str) -> Optional[str]:
         """
         Get channel ID from username or channel URL.
         
@@ -66,67 +114,56 @@ class YouTubeChannelVideoFetcher:
             Channel ID if found, None otherwise
         """
         logger.info(f"  Getting channel ID for username \"{username}\"")
+        # Classify the identifier in a single pass over the string
+        match = _CHANNEL_URL_RE.search(username)
+        kind = match.lastgroup if match else None
+        
         try:
-            # Handle different URL formats
-            if username.startswith('@'):
-                # Handle new @username format
-                handle = username[1:]  # Remove @ symbol
-                request = self.youtube.channels().list(
+            if kind in ('handle', 'bare_handle'):
+                # New @username format, bare or inside a URL
+                response = await self._get(
+                    'channels',
                     part='id',
-                    forHandle=handle
+                    forHandle=match.group(kind)
                 )
-                response = request.execute()
                 
-                if response['items']:
-                    return response['items'][0]['id']
-                    
-            elif 'youtube.com' in username:
-                # Extract username/handle from URL
-                if '/@' in username:
-                    handle = username.split('/@')[-1].split('/')[0].split('?')[0]
-                    request = self.youtube.channels().list(
-                        part='id',
-                        forHandle=handle
-                    )
-                    response = request.execute()
-                    
-                    if response['items']:
-                        return response['items'][0]['id']
-                elif '/channel/' in username:
-                    # Direct channel ID in URL
-                    return username.split('/channel/')[-1].split('/')[0].split('?')[0]
-                elif '/c/' in username or '/user/' in username:
-                    # Legacy username format
-                    username_part = username.split('/')[-1].split('?')[0]
-                    request = self.youtube.channels().list(
-                        part='id',
-                        forUsername=username_part
-                    )
-                    response = request.execute()
-                    
-                    if response['items']:
-                        return response['items'][0]['id']
+            elif kind == 'channel_id':
+                # Direct channel ID in URL
+                return match.group(kind)
+            
+            elif kind == 'username':
+                # Legacy /c/ or /user/ username format
+                response = await self._get(
+                    'channels',
+                    part='id',
+                    forUsername=match.group(kind)
+                )
+                
+            elif kind == 'other_url':
+                # A youtube.com URL that doesn't identify a channel
+                return None
+            
+            # Assume it's already a channel ID or username
+            elif _CHANNEL_ID_RE.fullmatch(username):  # Channel ID format
+                return username
+            
             else:
-                # Assume it's already a channel ID or username
-                if len(username) == 24 and username.isalnum():  # Channel ID format
-                    return username
-                else:
-                    # Try as username
-                    request = self.youtube.channels().list(
-                        part='id',
-                        forUsername=username
-                    )
-                    response = request.execute()
-                    
-                    if response['items']:
-                        return response['items'][0]['id']
-                        
-        except HttpError as e:
+                # Try as username
+                response = await self._get(
+                    'channels',
+                    part='id',
+                    forUsername=username
+                )
+            
+            if response['items']:
+                return response['items'][0]['id']
+
+        except aiohttp.ClientResponseError as e:
             logger.error(f"  Error fetching channel ID: {e}")
             
         return None
     
-    def get_channel_info(self, channel_id: str) -> Optional[Dict]:
+    async def get_channel_info(self, channel_id: str) -> Optional[Dict]:
         """
         Get basic information about the channel.
         
@@ -137,11 +174,11 @@ class YouTubeChannelVideoFetcher:
             Dictionary containing channel information
         """
         try:
-            request = self.youtube.channels().list(
+            response = await self._get(
+                'channels',
                 part='snippet,statistics',
                 id=channel_id
             )
-            response = request.execute()
             
             if not response['items']:
                 return None
@@ -157,14 +194,41 @@ class YouTubeChannelVideoFetcher:
                 'video_count': channel['statistics'].get('videoCount', 0),
                 'view_count': channel['statistics'].get('viewCount', 0)
             }
-        except HttpError as e:
+        except aiohttp.ClientResponseError as e:
             logger.error(f"  Error fetching channel info: {e}")
             return None
     
-    def get_video_ids(self, channel_id: str, max_videos: int = 100) -> List[str]:
+    @cached(key=lambda self, channel_id: channel_id)
+    async def _get_uploads_playlist_id(self, channel_id: str) -> Optional[str]:
+        """
+        Get the ID of the playlist holding all of a channel's uploads.
+        
+        Args:
+            channel_id: YouTube channel ID
+            
+        Returns:
+            Uploads playlist ID if the channel exists, None otherwise
+            
+        Raises:
+            aiohttp.ClientResponseError: If the API responds with an error status
+        """
+        response = await self._get(
+            'channels',
+            part='contentDetails',
+            id=channel_id
+        )
+        
+        if not response.get('items'):
+            return None
+        return response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+    
+    async def get_video_ids(self, channel_id: str, max_videos: int = 100) -> List[str]:
         """
         Fetch video IDs from a YouTube channel up to a specified maximum.
         
+        Pages through the channel's uploads playlist, which costs 1 quota unit per page
+        (search costs 100) and isn't capped at ~500 results.
+        
         Args:
             channel_id: YouTube channel ID
             max_videos: Maximum number of videos to fetch (default: 100)
@@ -178,48 +242,46 @@ class YouTubeChannelVideoFetcher:
         logger.info(f"  Fetching up to {max_videos} videos for channel ID: {channel_id}")
         
         try:
+            uploads_playlist_id = await self._get_uploads_playlist_id(channel_id)
+            if not uploads_playlist_id:
+                logger.error("  Error: Channel not found.")
+                return video_ids
+            
             while len(video_ids) < max_videos:
                 # Calculate how many videos to request in this batch
                 remaining_videos = max_videos - len(video_ids)
                 batch_size = min(MAX_QUERY_SIZE, remaining_videos)
                 
-                # Get videos from the channel
-                request = self.youtube.search().list(
-                    part='id',
-                    channelId=channel_id,
-                    type='video',
+                # Get videos from the channel (the uploads playlist lists newest first)
+                response = await self._get(
+                    'playlistItems',
+                    part='contentDetails',
+                    playlistId=uploads_playlist_id,
                     maxResults=batch_size,
-                    pageToken=next_page_token,
-                    order='date'  # Order by upload date (newest first)
+                    pageToken=next_page_token
                 )
                 
-                response = request.execute()
-                
                 # Extract video IDs
                 for item in response['items']:
-                    if item['id']['kind'] == 'youtube#video':
-                        video_ids.append(item['id']['videoId'])
-                        
-                        # Stop if we've reached the maximum
-                        if len(video_ids) >= max_videos:
-                            break
+                    video_ids.append(item['contentDetails']['videoId'])
+                    
+                    # Stop if we've reached the maximum
+                    if len(video_ids) >= max_videos:
+                        break
                 
                 # Check if there are more pages and we haven't reached the limit
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token or len(video_ids) >= max_videos:
                     break
                 
-                # Rate limiting - YouTube API has quotas
-                time.sleep(0.1)
-                
                 # Progress indicator
                 if len(video_ids) % 50 == 0:
                     logger.info(f"  Fetched {len(video_ids)} video IDs so far...")
                 
-        except HttpError as e:
-            if e.resp.status == 403:
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
                 logger.error("  Error: API quota exceeded or access denied. Please check your API key and quota.")
-            elif e.resp.status == 404:
+            elif e.status == 404:
                 logger.error("  Error: Channel not found.")
             else:
                 logger.error(f"  Error fetching videos: {e}")
@@ -227,9 +289,9 @@ class YouTubeChannelVideoFetcher:
         logger.info(f"  Successfully fetched {len(video_ids)} video IDs")
         return video_ids
 
-    def get_all_video_ids(self, channel_id: str) -> List[str]:
+    async def get_all_video_ids(self, channel_id: str) -> List[str]:
         """
-        Fetch all video IDs from a YouTube channel.
+        Fetch all video IDs from a YouTube channel, via its uploads playlist (see `get_video_ids`).
         
         Args:
             channel_id: YouTube channel ID
@@ -243,40 +305,38 @@ class YouTubeChannelVideoFetcher:
         logger.info(f"  Fetching videos for channel ID: {channel_id}")
         
         try:
+            uploads_playlist_id = await self._get_uploads_playlist_id(channel_id)
+            if not uploads_playlist_id:
+                logger.error("  Error: Channel not found.")
+                return all_video_ids
+            
             while True:
-                # Get videos from the channel
-                request = self.youtube.search().list(
-                    part='id',
-                    channelId=channel_id,
-                    type='video',
+                # Get videos from the channel (the uploads playlist lists newest first)
+                response = await self._get(
+                    'playlistItems',
+                    part='contentDetails',
+                    playlistId=uploads_playlist_id,
                     maxResults=MAX_QUERY_SIZE,
-                    pageToken=next_page_token,
-                    order='date'  # Order by upload date (newest first)
+                    pageToken=next_page_token
                 )
                 
-                response = request.execute()
-                
                 # Extract video IDs
                 for item in response['items']:
-                    if item['id']['kind'] == 'youtube#video':
-                        all_video_ids.append(item['id']['videoId'])
+                    all_video_ids.append(item['contentDetails']['videoId'])
                 
                 # Check if there are more pages
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
                 
-                # Rate limiting - YouTube API has quotas
-                time.sleep(0.1)
-                
                 # Progress indicator
                 if len(all_video_ids) % 100 == 0:
                     logger.info(f"  Fetched {len(all_video_ids)} video IDs so far...")
                 
-        except HttpError as e:
-            if e.resp.status == 403:
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
                 logger.error("  Error: API quota exceeded or access denied. Please check your API key and quota.")
-            elif e.resp.status == 404:
+            elif e.status == 404:
                 logger.error("  Error: Channel not found.")
             else:
                 logger.error(f"  Error fetching videos: {e}")
@@ -284,9 +344,10 @@ class YouTubeChannelVideoFetcher:
         logger.info(f"  Successfully fetched {len(all_video_ids)} video IDs")
         return all_video_ids
     
-    def get_video_details(self, video_ids: List[str]) -> List[Dict]:
+    async def get_video_details(self, video_ids: List[str]) -> List[Dict]:
         """
-        Get detailed information for a list of video IDs.
+        Get detailed information for a list of video IDs. Details cached by a previous
+        run are reused, so only uncached IDs are requested from the API.
         
         Args:
             video_ids: List of YouTube video IDs
@@ -294,42 +355,53 @@ class YouTubeChannelVideoFetcher:
         Returns:
             List of video detail dictionaries
         """
-        video_details = []
+        cache = _get_disk_cache()
+        video_details = {}
+        misses = []
+        
+        for video_id in video_ids:
+            detail = cache.get(f"video_details:{video_id}")
+            if detail is None:
+                misses.append(video_id)
+            else:
+                video_details[video_id] = detail
+        
+        logger.info(f"  {len(video_details)} of {len(video_ids)} video details found in cache")
         
         # YouTube API allows up to 50 video IDs per request
         batch_size = 50
         
-        for i in range(0, len(video_ids), batch_size):
-            batch = video_ids[i:i + batch_size]
+        for i in range(0, len(misses), batch_size):
+            batch = misses[i:i + batch_size]
             
             try:
-                request = self.youtube.videos().list(
+                async with self._request(
+                    'videos',
                     part='snippet,statistics',
-                    id=','.join(batch)
-                )
-                response = request.execute()
-                
-                for video in response['items']:
-                    video_details.append({
-                        'id': video['id'],
-                        'title': video['snippet']['title'],
-                        'description': video['snippet']['description'],
-                        'published_at': video['snippet']['publishedAt'],
-                        'view_count': video['statistics'].get('viewCount', 0),
-                        'like_count': video['statistics'].get('likeCount', 0),
-                        'comment_count': video['statistics'].get('commentCount', 0),
-                        'duration': video['snippet'].get('duration', ''),
-                        'thumbnail_url': video['snippet']['thumbnails'].get('default', {}).get('url', '')
-                    })
+                    id=','.join(batch),
+                    fields=VIDEO_DETAILS_FIELDS
+                ) as resp:
+                    # Stream the items out of the body instead of materializing the whole response
+                    async for video in ijson.items(resp.content, 'items.item', use_float=True):
+                        detail = {
+                            'id': video['id'],
+                            'title': video['snippet']['title'],
+                            'description': video['snippet']['description'],
+                            'published_at': video['snippet']['publishedAt'],
+                            'view_count': video['statistics'].get('viewCount', 0),
+                            'like_count': video['statistics'].get('likeCount', 0),
+                            'comment_count': video['statistics'].get('commentCount', 0),
+                            'duration': video['snippet'].get('duration', ''),
+                            'thumbnail_url': video['snippet'].get('thumbnails', {}).get('default', {}).get('url', '')
+                        }
+                        video_details[detail['id']] = detail
+                        cache.set(f"video_details:{detail['id']}", detail, expire=VIDEO_DETAILS_EXPIRE)
                 
-                # Rate limiting
-                time.sleep(0.1)
-                
-            except HttpError as e:
+            except aiohttp.ClientResponseError as e:
                 logger.error(f"  Error fetching video details for batch: {e}")
                 continue
         
-        return video_details
+        return [video_details[video_id] for video_id in video_ids if video_id in video_details]
     
     def save_video_ids_to_file(self, video_ids: List[str], filename: str):
         """
@@ -340,9 +412,10 @@ class YouTubeChannelVideoFetcher:
             filename: Output filename
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                for video_id in video_ids:
-                    f.write(f"{video_id}\n")
+            # Video IDs are pure ASCII: join once and write the bytes in a single call
+            data = '\n'.join(video_ids) + '\n' if video_ids else ''
+            with open(filename, 'wb') as f:
+                f.write(data.encode('ascii'))
             logger.info(f"  Video IDs saved to {filename}")
         except Exception as e:
             logger.error(f"  Error saving video IDs: {e}")
@@ -355,11 +428,18 @@ class YouTubeChannelVideoFetcher:
             video_details: List of video detail dictionaries
             filename: Output filename
         """
+        # Serialize first, then write to a temporary file and rename it into place, so a crash never
+        # leaves a truncated file
+        tmp_filename = f"{filename}.tmp"
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(video_details, f, indent=2, ensure_ascii=False)
+            data = orjson.dumps(video_details, option=orjson.OPT_INDENT_2)
+            with open(tmp_filename, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_filename, filename)
             logger.info(f"  Video details saved to {filename}")
         except Exception as e:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_filename)
             logger.error(f"  Error saving video details: {e}")
 
 
@@ -375,43 +455,49 @@ def get_channel_videos(channel_identifier: str, max_videos: int, output_ids_file
         output_details_file: File to save video details (optional)
         include_details: Whether to fetch detailed video information
     """
+    return asyncio.run(_get_channel_videos(channel_identifier, max_videos, output_ids_file,
+                                           output_details_file, include_details))
+
+
+async def _get_channel_videos(channel_identifier: str, max_videos: int, output_ids_file: Optional[str],
+                              output_details_file: Optional[str], include_details: bool):
+    """Coroutine behind `get_channel_videos`."""
     try:
         from config import YOUTUBE_API_KEY
     except ImportError:
         logger.error("  Error: YOUTUBE_API_KEY not found in config.py")
         sys.exit(1)
     
-    # Initialize the fetcher
-    fetcher = YouTubeChannelVideoFetcher(api_key=YOUTUBE_API_KEY)
-    
-    # Get channel ID
-    logger.info("  Resolving channel identifier...")
-    channel_id = fetcher.get_channel_id_from_username(channel_identifier)
-    
-    if not channel_id:
-        logger.error(f"  Error: Could not find channel with identifier: {channel_identifier}")
-        sys.exit(1)
-    
-    logger.info(f"  Found channel ID: {channel_id}")
-    
-    # Fetch all video IDs
-    video_ids = fetcher.get_video_ids(channel_id, max_videos=50)
-    
-    if not video_ids:
-        logger.warning("  No videos found or error occurred.")
-        return
-    
-    # Save video IDs if requested
-    if output_ids_file:
-        fetcher.save_video_ids_to_file(video_ids, output_ids_file)
-    
-    # Get video details if requested
-    if include_details:
-        logger.info("  Fetching video details...")
-        video_details = fetcher.get_video_details(video_ids)
+    # Initialize the fetcher; its HTTP session is shared by every request below
+    async with YouTubeChannelVideoFetcher(api_key=YOUTUBE_API_KEY) as fetcher:
+        # Get channel ID
+        logger.info("  Resolving channel identifier...")
+        channel_id = await fetcher.get_channel_id_from_username(channel_identifier)
+        
+        if not channel_id:
+            logger.error(f"  Error: Could not find channel with identifier: {channel_identifier}")
+            sys.exit(1)
         
-        if output_details_file:
-            fetcher.save_video_details_to_file(video_details, output_details_file)
+        logger.info(f"  Found channel ID: {channel_id}")
+        
+        # Fetch all video IDs
+        video_ids = await fetcher.get_video_ids(channel_id, max_videos=50)
+        
+        if not video_ids:
+            logger.warning("  No videos found or error occurred.")
+            return
+        
+        # Save video IDs if requested
+        if output_ids_file:
+            fetcher.save_video_ids_to_file(video_ids, output_ids_file)
+        
+        # Get video details if requested
+        if include_details:
+            logger.info("  Fetching video details...")
+            video_details = await fetcher.get_video_details(video_ids)
+            
+            if output_details_file:
+                fetcher.save_video_details_to_file(video_details, output_details_file)
     
     if include_details:
         logger.info(f"  Video details fetched: {len(video_details)}")
@@ -1,22 +1,107 @@
 import logging
+import os
+import pickle
+import string
 import nltk
+import numpy as np
 from nltk.sentiment import SentimentIntensityAnalyzer
-# from typing import Dict
+from nltk.sentiment.vader import VaderConstants
+from typing import List, Tuple
 
-# Graceful download check for vader_lexicon (nltk data file needed for sentiment analysis)
-try:
-  nltk.data.find('sentiment/vader_lexicon.zip')
-except LookupError:
-  print("comment_analysis.py: vader_lexicon not found -- installing now")
-  nltk.download('vader_lexicon')
+# Parsed VADER lexicon, pickled on first run so later runs skip parsing vader_lexicon.txt. It lives next to
+# this module (not in the working directory) and is only used if it was built from the installed lexicon
+LEXICON_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.vader.pkl')
 
-sia = SentimentIntensityAnalyzer()
+def _lexicon_key() -> Tuple:
+  """Identifies the installed lexicon: the nltk version and the path, size and mtime of the lexicon file"""
+  # Graceful download check for vader_lexicon (nltk data file needed for sentiment analysis)
+  try:
+    pointer = nltk.data.find('sentiment/vader_lexicon.zip')
+  except LookupError:
+    print("comment_analysis.py: vader_lexicon not found -- installing now")
+    nltk.download('vader_lexicon')
+    pointer = nltk.data.find('sentiment/vader_lexicon.zip')
+
+  path = pointer.zipfile.filename if isinstance(pointer, nltk.data.ZipFilePathPointer) else pointer.path
+  stat = os.stat(path)
+  return (nltk.__version__, path, stat.st_size, stat.st_mtime_ns)
+
+def _load_analyzer() -> SentimentIntensityAnalyzer:
+  """Builds the analyzer from the pickled lexicon, re-parsing the lexicon if the pickle is missing, stale or unreadable"""
+  key = _lexicon_key()
+  try:
+    with open(LEXICON_CACHE, 'rb') as file:
+      cached_key, lexicon = pickle.load(file)
+    if cached_key == key:
+      # Same state SentimentIntensityAnalyzer.__init__ sets up, minus the text parse
+      analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+      analyzer.lexicon = lexicon
+      analyzer.constants = VaderConstants()
+      return analyzer
+  except Exception:
+    pass # Fall back to parsing the lexicon below
+
+  analyzer = SentimentIntensityAnalyzer()
+  # Per-process temporary file: several worker processes may import this module at once
+  tmp_path = f'{LEXICON_CACHE}.{os.getpid()}.tmp'
+  try:
+    with open(tmp_path, 'wb') as file:
+      pickle.dump((key, analyzer.lexicon), file, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, LEXICON_CACHE)
+  except OSError:
+    pass # e.g. a read-only install: keep working, just without the cache
+  return analyzer
+
+sia = _load_analyzer()
+
+# Word -> valence table, looked up directly by the batch scorer
+_LEXICON = sia.lexicon
 
 def get_polarity_scores(comment):
   scores = sia.polarity_scores(comment)
   # print(f"Comment: \"{comment}\" has polarity score of: {scores} ")
   return scores
 
+def factorize(texts: List[str]) -> Tuple[np.ndarray, List[str]]:
+  """
+  Encodes texts as indices into their unique values (like pandas.factorize), so that
+  repeated comments only need to be scored once: uniques[codes[i]] == texts[i]
+  """
+  index = {}
+  codes = np.fromiter((index.setdefault(text, len(index)) for text in texts), dtype=np.intp, count=len(texts))
+  return codes, list(index)
+
+def _has_lexicon_hit(tokens: List[str]) -> bool:
+  """
+  True if any token might be scored by VADER. VADER only strips leading or trailing
+  punctuation from a token, so checking each token with and without it never misses a hit.
+  """
+  for token in tokens:
+    token = token.lower()
+    if token in _LEXICON or token.strip(string.punctuation) in _LEXICON:
+      return True
+  return False
+
+def get_polarity_scores_batch(texts: List[str]) -> np.ndarray:
+  """
+  Scores a list of comments, returning an (N, 3) float32 array of (pos, neu, neg) rows.
+  Comments without any lexicon words skip the full VADER pass; VADER would score those
+  as all zeros (no tokens) or entirely neutral, so the results are identical.
+  """
+  scores = np.zeros((len(texts), 3), dtype=np.float32)
+  polarity_scores = sia.polarity_scores
+  for i, text in enumerate(texts):
+    # Same tokenization as VADER: whitespace split, single characters dropped
+    tokens = [token for token in text.split() if len(token) > 1]
+    if not tokens:
+      continue
+    if not _has_lexicon_hit(tokens):
+      scores[i, 1] = 1.0
+      continue
+    score = polarity_scores(text)
+    scores[i] = (score['pos'], score['neu'], score['neg'])
+  return scores
+
 if __name__ == '__main__':
   comment = "Bro this sucks."
   scores = get_polarity_scores(comment)
@@ -3,18 +3,89 @@ For a given YouTube channel, get the videos, get the comments for each video,
 run Vader analysis on the comments and then calculate some stats
 """
 
+import asyncio
 import logging
+import multiprocessing
 import sys
 import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Optional, List
 from datetime import datetime
 from channel_videos import get_channel_videos
-from youtube_comments import get_video_comments
-from comment_analysis import get_polarity_scores
+from youtube_comments import YouTubeCommentsFetcher, load_api_key
+from comment_analysis import get_polarity_scores_batch, factorize
 from vaderscores import VaderScores
-from setup_logging import setup_logging
+from setup_logging import setup_logging, setup_worker_logging, start_log_listener
+from youtube_api import set_process_count
 
-def rate_channel_by_comments(channel_id: str, max_comments_per_vid: int, max_videos: int, tags: Optional[List[str]] = None):
+# Comments per scoring task, so that even a single large video is spread across every worker
+SCORING_CHUNK_SIZE = 250
+
+async def score_on_pool(pool: ProcessPoolExecutor, texts: List[str]) -> np.ndarray:
+  """Scores texts in parallel on the pool, one chunk per task, returning the (N, 3) score rows in order"""
+  loop = asyncio.get_running_loop()
+  chunks = [loop.run_in_executor(pool, get_polarity_scores_batch, texts[i:i + SCORING_CHUNK_SIZE])
+            for i in range(0, len(texts), SCORING_CHUNK_SIZE)]
+  return np.concatenate(await asyncio.gather(*chunks))
+
+async def fetch_and_score(video_ids: List[str], max_comments_per_vid: int, scores: VaderScores,
+                          max_workers: Optional[int] = None):
+  """
+  Fetch the comments of every video concurrently over one shared HTTP session, and score
+  each video's comments on a process pool (of max_workers processes, default: one per core)
+  as soon as they arrive, so that scoring overlaps with the remaining fetches
+  """
+  logger = logging.getLogger(__name__)
+  queue = asyncio.Queue()
+
+  async with YouTubeCommentsFetcher(api_key=load_api_key()) as fetcher:
+    async def produce(video_id: str):
+      comments = await fetcher.get_comments_async(video_id, max_comments_per_vid)
+      if not comments:
+        logger.warning(f"No comments were retrieved on video {video_id}.")
+      await queue.put(comments)
+
+    async def produce_all():
+      tasks = [asyncio.create_task(produce(video_id)) for video_id in video_ids]
+      try:
+        await asyncio.gather(*tasks)
+      except BaseException:
+        # One producer failed: stop the others too, so the whole channel fails rather than a part of it
+        for task in tasks:
+          task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+      finally:
+        await queue.put(None) # Sentinel: every producer has finished
+
+    producers = asyncio.create_task(produce_all())
+
+    # VADER is pure Python and holds the GIL, so score in processes rather than threads
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+      pending = []
+      try:
+        while (comments := await queue.get()) is not None:
+          if comments:
+            # Score each distinct text once, then expand back to one row per comment
+            codes, unique_texts = factorize([comment['text'] for comment in comments])
+            likes = np.array([comment['like_count'] for comment in comments])
+            pending.append((asyncio.create_task(score_on_pool(pool, unique_texts)), codes, likes))
+
+        # Raise a producer failure now, before any scores are recorded and while the session is still open
+        await producers
+
+        for unique_scores, codes, likes in pending:
+          scores.add_scores_bulk((await unique_scores)[codes], likes)
+      except BaseException:
+        producers.cancel()
+        for unique_scores, _, _ in pending:
+          unique_scores.cancel()
+        raise
+
+def rate_channel_by_comments(channel_id: str, max_comments_per_vid: int, max_videos: int, tags: Optional[List[str]] = None,
+                             scoring_workers: Optional[int] = None):
   logger = logging.getLogger(__name__)
   logger.info(f"Starting analysis for channel: {channel_id}")
   videos = get_channel_videos(channel_id, max_videos=max_videos)
@@ -23,25 +94,37 @@ def rate_channel_by_comments(channel_id: str, max_comments_per_vid: int, max_vid
   scores = VaderScores(channel_id, tags)
 
   # Limit to max_vids videos
-  for video_id in videos[:max_videos]:
-    comments = get_video_comments(video_id, max_comments = max_comments_per_vid)
-    if comments:
-      for comment in comments:
-      # for comment in comments[:max_comments_per_vid]:
-        score = get_polarity_scores(comment['text'])
-        like_count = comment['like_count']
-        scores.add_score(score, like_count)
-
+  asyncio.run(fetch_and_score(videos[:max_videos], max_comments_per_vid, scores, max_workers=scoring_workers))
 
   scores.report_all()
   # return scores.weighted_average_scores(), scores.kindness(), scores.volatility()
 
+def init_channel_worker(log_queue, process_count: int):
+  """Initializer for the per-channel processes: route logs to the parent and take a share of the API rate"""
+  setup_worker_logging(log_queue)
+  set_process_count(process_count)
+
 def save_data(channel_id, data):
   pass
 
 
 if __name__ == '__main__':
   logger = setup_logging()
-  for channel_id in ["@SkyDoesShorts", "@PhilosophyTube", "@DaveyWaveyRaw", "@TylerOakley"]:
-    rate_channel_by_comments(channel_id, max_comments_per_vid=1000, max_videos=50, tags=["queer"])
+  channel_ids = ["@SkyDoesShorts", "@PhilosophyTube", "@DaveyWaveyRaw", "@TylerOakley"]
+
+  # Channels are independent, so rate them in parallel processes. Each process opens its own
+  # API sessions with an equal share of the API request rate, and the cores are split between their scoring pools
+  scoring_workers = max(1, (os.cpu_count() or 1) // len(channel_ids))
+  rate_channel = partial(rate_channel_by_comments, max_comments_per_vid=1000, max_videos=50, tags=["queer"],
+                         scoring_workers=scoring_workers)
+  # Under spawn or forkserver the workers start without any logging handlers, so they log through a queue
+  # that the parent drains into its own handlers
+  log_queue = multiprocessing.Queue()
+  listener = start_log_listener(log_queue)
+  try:
+    with ProcessPoolExecutor(max_workers=len(channel_ids), initializer=init_channel_worker,
+                             initargs=(log_queue, len(channel_ids))) as executor:
+      list(executor.map(rate_channel, channel_ids))
+  finally:
+    listener.stop()
   
\ No newline at end of file
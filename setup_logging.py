@@ -1,7 +1,14 @@
 import logging
+import logging.handlers
 import sys
 from datetime import datetime
 
+def _quiet_third_party_loggers():
+  # Supress verbose logging from third-party libraries:
+  logging.getLogger('googleapiclient.discovery_cache').setLevel(logging.WARNING)
+  logging.getLogger('googleapiclient.discovery').setLevel(logging.WARNING)
+  logging.getLogger('urllib3').setLevel(logging.WARNING)
+
 def setup_logging():
   """Configure logging for the CommenTone application"""
   # Create log directory if it doesn't exist.
@@ -20,12 +27,23 @@ def setup_logging():
     ]
   )
 
-  # Supress verbose logging from third-party libraries:
-  logging.getLogger('googleapiclient.discovery_cache').setLevel(logging.WARNING)
-  logging.getLogger('googleapiclient.discovery').setLevel(logging.WARNING)
-  logging.getLogger('urllib3').setLevel(logging.WARNING)
+  _quiet_third_party_loggers()
 
   # Create instance of module-level logger
   logger = logging.getLogger(__name__)
   logger.info(f"  Logger initialized. Log file: {log_filename}")
   return logger
+
+def start_log_listener(queue):
+  """Write records that worker processes put on `queue` to this process's handlers (call after setup_logging)"""
+  listener = logging.handlers.QueueListener(queue, *logging.getLogger().handlers, respect_handler_level=True)
+  listener.start()
+  return listener
+
+def setup_worker_logging(queue):
+  """Configure logging in a worker process: every record is sent to the parent's listener through `queue`"""
+  root = logging.getLogger()
+  # Forked workers inherit the parent's handlers; replace them so nothing is written twice
+  root.handlers = [logging.handlers.QueueHandler(queue)]
+  root.setLevel(logging.DEBUG)
+  _quiet_third_party_loggers()
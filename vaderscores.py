@@ -1,47 +1,85 @@
 from typing import Optional, Dict, List
-import json
 import os
+import pathlib
 from datetime import datetime
+import numpy as np
+import orjson
+
+# Number of rows allocated up front; the buffer doubles whenever it fills
+INITIAL_CAPACITY = 1024
+
+# Rows per float32 partial sum in the weighted reduction; partial sums are combined in float64
+REDUCTION_BLOCK = 65536
+
+# Reports are written here; created once on import rather than on every report
+_OUT_DIR = pathlib.Path('channel-ratings')
+_OUT_DIR.mkdir(exist_ok=True)
 
 class VaderScores:
   def __init__(self, channel_id: str, tags: Optional[List[str]] = None):
     self.channel_id = channel_id
     self.tags = tags
-    self.pos_scores = []
-    self.neu_scores = []
-    self.neg_scores = []
-    self.weights = [] # Multiplicative weight for the score
+    # One row per comment: (pos, neu, neg, weight), where weight is the multiplicative weight for the score.
+    # VADER scores only carry 3 decimal places, so float32 storage is plenty; reductions accumulate in float64
+    self._buf = np.empty((INITIAL_CAPACITY, 4), dtype=np.float32)
+    self._n = 0
+
+  def _reserve(self, extra: int):
+    """Grows the buffer (by doubling) so that `extra` more rows fit"""
+    needed = self._n + extra
+    capacity = len(self._buf)
+    if needed <= capacity:
+      return
+    while capacity < needed:
+      capacity *= 2
+    buf = np.empty((capacity, 4), dtype=self._buf.dtype)
+    buf[:self._n] = self._buf[:self._n]
+    self._buf = buf
   
   def add_score(self, score: Dict, likes: int):
-    self.pos_scores.append(score['pos'])
-    self.neu_scores.append(score['neu'])
-    self.neg_scores.append(score['neg'])
-    self.weights.append(likes + 1) # Multiplicative factor (likes start at zero, so we add 1 to compensate)
+    self._reserve(1)
+    # Multiplicative factor (likes start at zero, so we add 1 to compensate)
+    self._buf[self._n] = (score['pos'], score['neu'], score['neg'], likes + 1)
+    self._n += 1
+
+  def add_scores_bulk(self, scores: np.ndarray, likes: np.ndarray):
+    """Adds a batch of scores: an (N, 3) array of (pos, neu, neg) rows and the N like counts"""
+    count = len(scores)
+    self._reserve(count)
+    self._buf[self._n:self._n + count, :3] = scores
+    self._buf[self._n:self._n + count, 3] = likes + 1
+    self._n += count
 
   def average_scores(self):
     """Calculates the average score"""
-    avg_pos = sum(self.pos_scores) / len(self.pos_scores)
-    avg_neu = sum(self.neu_scores) / len(self.neu_scores)
-    avg_neg = sum(self.neg_scores) / len(self.neg_scores)
-    return {"avg_pos": round(avg_pos, 3), 
-            "avg_neu": round(avg_neu, 3), 
-            "avg_neg": round(avg_neg, 3)}
+    if not self._n:
+      raise ValueError(f"VaderScores for {self.channel_id} has no scores to average")
+    avg_pos, avg_neu, avg_neg = self._buf[:self._n, :3].mean(axis=0, dtype=np.float64)
+    return {"avg_pos": round(float(avg_pos), 3), 
+            "avg_neu": round(float(avg_neu), 3), 
+            "avg_neg": round(float(avg_neg), 3)}
   
   def weighted_average_scores(self):
     """Calculates the weighted average score using comment likes as weights"""
-    if not self.weights or sum(self.weights) == 0:
+    if not self._n:
+      raise ValueError(f"VaderScores for {self.channel_id} has no scores to average")
+    weights = self._buf[:self._n, 3]
+    total_weight = weights.sum(dtype=np.float64)
+    if total_weight == 0:
       # If weights are not defined for some reason, return an unweighted average
       print("WARNING -- weights in VaderScores were improperly initialized. \"weighted_average_scores\" is defaulting to \"average_scores\"")
       return self.average_scores()
     
-    total_weight = sum(self.weights)
-    weighted_pos = sum(pos * weight for pos, weight in zip(self.pos_scores, self.weights)) / total_weight
-    weighted_neu = sum(neu * weight for neu, weight in zip(self.neu_scores, self.weights)) / total_weight
-    weighted_neg = sum(neg * weight for neg, weight in zip(self.neg_scores, self.weights)) / total_weight
+    # One pass over the packed rows: (N,) @ (N, 3) -> the three weighted sums, block by block
+    weighted_sums = np.zeros(3, dtype=np.float64)
+    for start in range(0, self._n, REDUCTION_BLOCK):
+      stop = min(start + REDUCTION_BLOCK, self._n)
+      weighted_sums += weights[start:stop] @ self._buf[start:stop, :3]
+    weighted_pos, weighted_neu, weighted_neg = weighted_sums / total_weight
     
-    return {"w_ave_pos": round(weighted_pos, 3), 
-            "w_ave_neu": round(weighted_neu, 3), 
-            "w_ave_neg": round(weighted_neg, 3)}
+    return {"w_ave_pos": round(float(weighted_pos), 3), 
+            "w_ave_neu": round(float(weighted_neu), 3), 
+            "w_ave_neg": round(float(weighted_neg), 3)}
 
   def kindness(self, P, N):
     """
@@ -61,7 +99,11 @@ class VaderScores:
     return 1/(Z + abs(P-N))
 
   def report_all(self):
-    num_comments = len(self.pos_scores)
+    num_comments = self._n
+    if not num_comments:
+      # Nothing to score (e.g. every video had comments disabled): skip the report rather than write empty ratings
+      print(f"WARNING -- no comments were analyzed for {self.channel_id}; skipping its report")
+      return
     average_scores = self.average_scores()
     weighted_average_scores = self.weighted_average_scores()
     P = weighted_average_scores['w_ave_pos']
@@ -81,12 +123,18 @@ class VaderScores:
       'volatility': volatility
     }
 
-    # Ensure the directory exists
-    os.makedirs('channel-ratings', exist_ok=True)
-    
-    # Open file in write mode to create it if it doesn't exist
-    with open(f'channel-ratings/{self.channel_id}.json', 'w') as file:
-      json.dump(results, file, indent=4)
+    # Serialize first, then write to a temporary file and rename it over the report, so a crash never
+    # leaves a truncated file
+    data = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    path = _OUT_DIR / f'{self.channel_id}.json'
+    tmp_path = _OUT_DIR / f'{self.channel_id}.json.tmp'
+    try:
+      with open(tmp_path, 'wb') as file:
+        file.write(data)
+      os.replace(tmp_path, path)
+    except OSError:
+      tmp_path.unlink(missing_ok=True)
+      raise
 
     print(f"\nChannel report for {self.channel_id}")
     print("*" * 25)
@@ -0,0 +1,137 @@
+"""
+YouTube Data API client
+
+Shared base for the async fetchers: one keep-alive aiohttp session per `async with`,
+a rate limiter, and retry with backoff when the API reports a rate limit.
+
+Requirements:
+- aiohttp library
+- aiolimiter library
+"""
+
+import sys
+import asyncio
+import contextlib
+import logging
+from typing import Dict, Optional
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+# REST endpoints are called directly (no discovery client) over one keep-alive session
+API_BASE_URL = 'https://www.googleapis.com/youtube/v3'
+MAX_CONNECTIONS = 32
+DNS_CACHE_TTL = 300
+
+# Token bucket for YouTube API calls: the allowed rate for one API key, across every process
+# using it. Each process gets an equal share (see set_process_count)
+MAX_REQUESTS_PER_SECOND = 10
+
+# Backoff is only applied when the API signals overload with one of these
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+MAX_RETRIES = 5
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+_process_count = 1
+
+
+def set_process_count(count: int):
+    """Split MAX_REQUESTS_PER_SECOND between `count` processes; call it in each process before creating clients."""
+    global _process_count
+    _process_count = max(1, count)
+
+
+async def _is_rate_limited(resp: aiohttp.ClientResponse) -> bool:
+    """True if the response is a 429, or a 403 whose error reason is a rate limit (not the daily quota)."""
+    if resp.status == 429:
+        return True
+    if resp.status != 403:
+        return False
+    try:
+        body = await resp.json(content_type=None)
+        errors = body['error']['errors']
+    except (ValueError, KeyError, TypeError):
+        return False
+    return any(error.get('reason') in RATE_LIMIT_REASONS for error in errors)
+
+
+def _retry_after(resp: aiohttp.ClientResponse) -> int:
+    """Seconds the server asked us to wait (defaults to 1)."""
+    try:
+        return int(resp.headers.get('Retry-After', '1'))
+    except ValueError:
+        return 1
+
+
+class YouTubeAPIClient:
+    """Rate-limited async access to the YouTube Data API v3 list endpoints."""
+
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the YouTubeAPIClient.
+
+        Args:
+            api_key: YouTube Data API key
+        """
+        self.api_key = api_key
+        self.session = None # aiohttp session, opened by `async with`
+        # One limiter per client: AsyncLimiter binds to the event loop it is first used in
+        self.limiter = AsyncLimiter(max_rate=MAX_REQUESTS_PER_SECOND / _process_count, time_period=1)
+        self._initialize_api()
+
+    def _initialize_api(self):
+        """Check that an API key was provided; requests are sent with it as the `key` parameter."""
+        if not self.api_key:
+            logger.error("  Error initializing YouTube API: api_key must be provided")
+            sys.exit(1)
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, ttl_dns_cache=DNS_CACHE_TTL)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+
+    @contextlib.asynccontextmanager
+    async def _request(self, resource: str, **params):
+        """
+        Call a YouTube Data API list endpoint, gated by the rate limiter. Successful calls
+        return immediately; rate-limited calls are retried after the server's Retry-After
+        delay, doubling it on each consecutive retry.
+
+        Args:
+            resource: Endpoint name, e.g. 'search' or 'videos'
+            **params: Query parameters (None values are dropped)
+
+        Yields:
+            The successful response, with its body still unread
+
+        Raises:
+            aiohttp.ClientResponseError: If the API responds with an error status
+        """
+        query = {key: value for key, value in params.items() if value is not None}
+        query['key'] = self.api_key
+        backoff = 1
+
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.limiter:
+                async with self.session.get(f'{API_BASE_URL}/{resource}', params=query) as resp:
+                    if resp.ok:
+                        yield resp
+                        return
+                    if attempt == MAX_RETRIES or not await _is_rate_limited(resp):
+                        resp.raise_for_status()
+                    delay = _retry_after(resp) * backoff
+
+            logger.warning(f"  Rate limited by the YouTube API, retrying in {delay}s...")
+            await asyncio.sleep(delay)
+            backoff *= 2
+
+    async def _get(self, resource: str, **params) -> Dict:
+        """Call a YouTube Data API list endpoint (see `_request`) and return the parsed JSON response."""
+        async with self._request(resource, **params) as resp:
+            return await resp.json()
@@ -8,6 +8,8 @@ from a YouTube video by its video ID.
 Requirements:
 - Google API key
 - google-api-python-client library
+- aiohttp library
+- aiolimiter library
 - requests library
 
 Usage:
@@ -19,8 +21,10 @@ import sys
 import time
 import logging
 from typing import List, Dict, Optional
+import aiohttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from youtube_api import YouTubeAPIClient
 # import os
 
 # Maximum number of comments threads requested per API query
@@ -29,7 +33,7 @@ MAX_QUERY_SIZE = 100
 # Module-level logger
 logger = logging.getLogger(__name__)
 
-class YouTubeCommentsFetcher:
+class YouTubeCommentsFetcher(YouTubeAPIClient):
     """Fetches comments from YouTube videos using the YouTube Data API v3."""
     
     def __init__(self, api_key: Optional[str] = None):
@@ -39,21 +43,18 @@ class YouTubeCommentsFetcher:
         Args:
             api_key: YouTube Data API key
         """
-        self.api_key = api_key
-        self.youtube = None # Discovery document
-        self._initialize_api()
+        self.youtube = None # Discovery client, built by the synchronous methods on first use
+        super().__init__(api_key)
     
-    def _initialize_api(self):
-        """Initialize the YouTube API client."""
-        try:
-            if self.api_key:
+    def _discovery_client(self):
+        """Build the synchronous discovery client on first use; the async path never needs it."""
+        if self.youtube is None:
+            try:
                 self.youtube = build('youtube', 'v3', developerKey=self.api_key)
-            else:
-                raise ValueError("api_key must be provided")
-                
-        except Exception as e:
-            logger.error(f" Error initializing YouTube API: {e}")
-            sys.exit(1)
+            except Exception as e:
+                logger.error(f" Error initializing YouTube API: {e}")
+                sys.exit(1)
+        return self.youtube
     
     def get_video_info(self, video_id: str) -> Dict:
         """
@@ -66,7 +67,7 @@ class YouTubeCommentsFetcher:
             Dictionary containing video information
         """
         try:
-            request = self.youtube.videos().list(
+            request = self._discovery_client().videos().list(
                 part='snippet,statistics',
                 id=video_id
             )
@@ -108,7 +109,7 @@ class YouTubeCommentsFetcher:
                 logger.info(f"  Querying for up to {MAX_QUERY_SIZE} top level comments...")
 
                 # Fetch a list of comment THREADS (not individual comments)
-                request = self.youtube.commentThreads().list(
+                request = self._discovery_client().commentThreads().list(
                     part='snippet,replies',
                     videoId=video_id,
                     maxResults=MAX_QUERY_SIZE,
@@ -174,7 +175,7 @@ class YouTubeCommentsFetcher:
                 logger.info(f"  Querying for up to {current_batch_size} top level comments...")
 
                 # Fetch a list of comment THREADS (not individual comments)
-                request = self.youtube.commentThreads().list(
+                request = self._discovery_client().commentThreads().list(
                     part='snippet,replies',
                     videoId=video_id,
                     maxResults=current_batch_size,
@@ -183,24 +184,7 @@ class YouTubeCommentsFetcher:
                 )
                 
                 response = request.execute()
-                
-                for item in response['items']:
-                    # Stop if we've reached the maximum
-                    if len_all_comments >= max_comments:
-                        break
-                        
-                    comment = self._extract_comment_data(item)
-                    all_comments.append(comment)
-                    len_all_comments += 1
-                    
-                    # Get replies to this comment (if we haven't reached the limit)
-                    if 'replies' in item and len(all_comments) < max_comments:
-                        for reply in item['replies']['comments']:
-                            if len_all_comments >= max_comments:
-                                break
-                            reply_data = self._extract_reply_data(reply, comment['id'])
-                            all_comments.append(reply_data)
-                            len_all_comments += 1
+                len_all_comments = self._collect_comments(response, all_comments, max_comments)
                 
                 # Check if there are more pages and we haven't reached our limit
                 next_page_token = response.get('nextPageToken')
@@ -222,6 +206,82 @@ class YouTubeCommentsFetcher:
         logger.info(f"  Successfully fetched {len_all_comments} comments (requested up to {max_comments})")
         return all_comments
     
+    async def get_comments_async(self, video_id: str, max_comments: int) -> List[Dict]:
+        """
+        Fetch comments from a YouTube video up to a specified maximum, without blocking
+        the event loop. Must be called inside `async with YouTubeCommentsFetcher(...)`.
+        
+        Args:
+            video_id: YouTube video ID
+            max_comments: Maximum number of comments to fetch
+            
+        Returns:
+            List of comment dictionaries (up to max_comments)
+        """
+        all_comments = []
+        len_all_comments = 0
+        next_page_token = None
+        
+        logger.info(f"  Fetching up to {max_comments} comments for video ID: {video_id}")
+        
+        try:
+            while len_all_comments < max_comments:
+                # Calculate how many comments we still need
+                remaining = max_comments - len_all_comments
+                current_batch_size = min(MAX_QUERY_SIZE, remaining)
+                
+                logger.info(f"  Querying for up to {current_batch_size} top level comments...")
+
+                # Fetch a list of comment THREADS (not individual comments)
+                response = await self._get(
+                    'commentThreads',
+                    part='snippet,replies',
+                    videoId=video_id,
+                    maxResults=current_batch_size,
+                    pageToken=next_page_token,
+                    order='relevance'
+                )
+                
+                len_all_comments = self._collect_comments(response, all_comments, max_comments)
+                
+                # Check if there are more pages and we haven't reached our limit
+                next_page_token = response.get('nextPageToken')
+                if not next_page_token or len_all_comments >= max_comments:
+                    break
+                
+        except aiohttp.ClientResponseError as e:
+            # Rate limits were already retried by _request, so a 403 here is the quota or the key
+            if e.status == 403:
+                logger.error("  API quota exceeded or access denied. Please check your API key and quota.")
+            elif e.status == 404:
+                logger.error("  Video not found or comments disabled.")
+            else:
+                logger.error(f"  Error fetching comments: {e}")
+            return all_comments
+        
+        logger.info(f"  Successfully fetched {len_all_comments} comments (requested up to {max_comments})")
+        return all_comments
+    
+    def _collect_comments(self, response: Dict, all_comments: List[Dict], max_comments: int) -> int:
+        """Append comments and replies from a commentThreads page, stopping at max_comments."""
+        for item in response['items']:
+            # Stop if we've reached the maximum
+            if len(all_comments) >= max_comments:
+                break
+                
+            comment = self._extract_comment_data(item)
+            all_comments.append(comment)
+            
+            # Get replies to this comment (if we haven't reached the limit)
+            if 'replies' in item and len(all_comments) < max_comments:
+                for reply in item['replies']['comments']:
+                    if len(all_comments) >= max_comments:
+                        break
+                    reply_data = self._extract_reply_data(reply, comment['id'])
+                    all_comments.append(reply_data)
+        
+        return len(all_comments)
+    
     def _extract_comment_data(self, item: Dict) -> Dict:
         """Extract comment data from API response."""
         snippet = item['snippet']['topLevelComment']['snippet']
@@ -268,17 +328,21 @@ class YouTubeCommentsFetcher:
             logger.error(f"Error saving comments: {e}")
 
 
-def get_video_comments(video_id: str, max_comments: int = 500):
+def load_api_key() -> str:
+    """Load YOUTUBE_API_KEY from config.py, exiting if it has not been configured."""
     try:
         from config import YOUTUBE_API_KEY
     except ImportError:
         print("YOUTUBE_API_KEY not found in config.py", ImportError)
         print("Have you configured your API key? Follow the instructions in config-template.py for more info")
         sys.exit(1)
-    
+    return YOUTUBE_API_KEY
+
+
+def get_video_comments(video_id: str, max_comments: int = 500):
     # Initialize the fetcher
     fetcher = YouTubeCommentsFetcher(
-        api_key=YOUTUBE_API_KEY
+        api_key=load_api_key()
     )
 
     # Fetch all comments